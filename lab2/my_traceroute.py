@@ -1,26 +1,274 @@
-from scapy.all import IP, ICMP, sr1
+from scapy.all import IP, ICMP, sr
+from concurrent.futures import ThreadPoolExecutor
+from packet_builder import resolve
+import ctypes
+import ctypes.util
+import ipaddress
+import os
+import select
 import socket
+import struct
+import time
+
+def _reverse_lookup(addr):
+    # Private / link-local / loopback hops (typical NAT gateways) have no
+    # public PTR record, so the query would only wait out the resolver
+    # timeout - return the literal without asking.
+    ip = ipaddress.ip_address(addr)
+    if ip.is_private or ip.is_link_local or ip.is_loopback or ip.is_reserved:
+        return addr
+    try:
+        return socket.gethostbyaddr(addr)[0]
+    except (socket.herror, OSError):
+        return addr
+
+def _ones_sum(data):
+    """Unfolded ones-complement sum of 16-bit words (RFC 1071)."""
+    if len(data) % 2:
+        data += b'\x00'
+    return sum(struct.unpack(f'!{len(data) // 2}H', data))
+
+def _build_probes(ident, max_hops):
+    """
+    Build all raw ICMP Echo Request probes from one template.
+
+    Header and payload are constant apart from the 16-bit sequence
+    number (which carries the probe's TTL), so the checksum base is
+    summed once and per probe only folded with the sequence - no
+    per-iteration packet rebuild or full re-checksum.
+
+    Returns:
+        List of (probe_bytes, ttl) tuples.
+    """
+    template = bytearray(struct.pack('!BBHHH', 8, 0, 0, ident, 0) + b'traceroute')
+    base_sum = _ones_sum(bytes(template))
+
+    probes = []
+    for ttl in range(1, max_hops + 1):
+        total = base_sum + ttl
+        total = (total >> 16) + (total & 0xFFFF)
+        total += total >> 16
+        struct.pack_into('!H', template, 2, ~total & 0xFFFF)
+        struct.pack_into('!H', template, 6, ttl)
+        probes.append((bytes(template), ttl))
+
+    return probes
+
+# ctypes mirrors of the Linux sendmmsg() structures
+class _iovec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p),
+                ("iov_len", ctypes.c_size_t)]
+
+class _msghdr(ctypes.Structure):
+    _fields_ = [("msg_name", ctypes.c_void_p),
+                ("msg_namelen", ctypes.c_uint),
+                ("msg_iov", ctypes.POINTER(_iovec)),
+                ("msg_iovlen", ctypes.c_size_t),
+                ("msg_control", ctypes.c_void_p),
+                ("msg_controllen", ctypes.c_size_t),
+                ("msg_flags", ctypes.c_int)]
+
+class _mmsghdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _msghdr),
+                ("msg_len", ctypes.c_uint)]
+
+def _sendmmsg_probes(sock, dst_ip, probes):
+    """
+    Push all probes to the kernel in one sendmmsg() syscall, each with
+    its own TTL attached as IP_TTL ancillary data. Returns False when
+    sendmmsg isn't available (non-Linux / old libc) so the caller can
+    fall back to per-probe sends.
+    """
+    libc_name = ctypes.util.find_library("c")
+    if libc_name is None:
+        return False
+    libc = ctypes.CDLL(libc_name, use_errno=True)
+    if not hasattr(libc, "sendmmsg"):
+        return False
+
+    # struct sockaddr_in for the destination (port 0)
+    addr = struct.pack('<H', socket.AF_INET) + b'\x00\x00' + \
+        socket.inet_aton(dst_ip) + b'\x00' * 8
+    addr_buf = ctypes.create_string_buffer(addr, len(addr))
+
+    # Keep every per-message buffer referenced until the call returns
+    keepalive = []
+    msgs = (_mmsghdr * len(probes))()
+
+    for i, (payload, ttl) in enumerate(probes):
+        data = ctypes.create_string_buffer(payload, len(payload))
+        iov = _iovec(ctypes.cast(data, ctypes.c_void_p), len(payload))
+
+        # cmsghdr { len, IPPROTO_IP, IP_TTL } + int ttl, padded to 8 bytes
+        cmsg = struct.pack('@LII', 20, socket.IPPROTO_IP, socket.IP_TTL)
+        cmsg += struct.pack('@i', ttl) + b'\x00' * 4
+        control = ctypes.create_string_buffer(cmsg, len(cmsg))
+        keepalive.append((data, iov, control))
+
+        hdr = msgs[i].msg_hdr
+        hdr.msg_name = ctypes.cast(addr_buf, ctypes.c_void_p)
+        hdr.msg_namelen = len(addr)
+        hdr.msg_iov = ctypes.pointer(keepalive[i][1])
+        hdr.msg_iovlen = 1
+        hdr.msg_control = ctypes.cast(control, ctypes.c_void_p)
+        hdr.msg_controllen = len(cmsg)
+
+    sent = libc.sendmmsg(sock.fileno(), msgs, len(probes), 0)
+    return sent == len(probes)
+
+def _collect_replies(sock, ident, timeout):
+    """
+    Read raw ICMP replies until the timeout and map them back to hops.
+
+    Returns (replies, final_hop): replies maps hop number -> source IP,
+    final_hop is the lowest hop that produced an Echo Reply (or None).
+    """
+    replies = {}
+    final_hop = None
+    deadline = time.monotonic() + timeout
+
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        readable, _, _ = select.select([sock], [], [], remaining)
+        if not readable:
+            break
+
+        packet, (src, _) = sock.recvfrom(2048)
+        ihl = (packet[0] & 0x0F) * 4
+        icmp_type = packet[ihl]
+
+        if icmp_type == 11 and len(packet) >= ihl + 8 + 28:
+            # Time Exceeded: the quoted inner packet holds our probe
+            inner = packet[ihl + 8:]
+            inner_ihl = (inner[0] & 0x0F) * 4
+            p_ident, p_seq = struct.unpack('!HH', inner[inner_ihl + 4:inner_ihl + 8])
+        elif icmp_type == 0 and len(packet) >= ihl + 8:
+            # Echo Reply straight from the destination
+            p_ident, p_seq = struct.unpack('!HH', packet[ihl + 4:ihl + 8])
+            if p_ident == ident and (final_hop is None or p_seq < final_hop):
+                final_hop = p_seq
+        else:
+            continue
+
+        if p_ident == ident:
+            replies.setdefault(p_seq, src)
+
+    return replies, final_hop
+
+def traceroute_raw(target, max_hops=30, timeout=2):
+    """
+    Traceroute over one raw ICMP socket: all probes leave in a single
+    sendmmsg() syscall (one sendto per probe as fallback) and replies
+    are parsed directly from the raw bytes - no per-probe scapy
+    bookkeeping in the hot path.
+    """
+    dst_ip = resolve(target)
+    print(f"\nTraceroute to {target}, max hops: {max_hops}...\n")
+
+    ident = os.getpid() & 0xFFFF
+    probes = _build_probes(ident, max_hops)
+
+    sock = socket.socket(socket.AF_INET, socket.SOCK_RAW, socket.IPPROTO_ICMP)
+    try:
+        sock.setblocking(False)
+        if not _sendmmsg_probes(sock, dst_ip, probes):
+            # Fallback path: one syscall per probe, TTL via setsockopt
+            for payload, ttl in probes:
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_TTL, ttl)
+                sock.sendto(payload, (dst_ip, 0))
+
+        replies, final_hop = _collect_replies(sock, ident, timeout)
+    finally:
+        sock.close()
+
+    last_hop = final_hop or max_hops
+
+    addrs = set(replies[ttl] for ttl in range(1, last_hop + 1) if ttl in replies)
+    if addrs:
+        # Cap each PTR query - a hung resolver shouldn't stall the listing
+        socket.setdefaulttimeout(1.0)
+        with ThreadPoolExecutor(max_workers=len(addrs)) as pool:
+            hosts = dict(zip(addrs, pool.map(_reverse_lookup, addrs)))
+    else:
+        hosts = {}
+
+    for ttl in range(1, last_hop + 1):
+        src = replies.get(ttl)
+
+        if src is None:
+            print(f"{ttl:2}  * * * Request timed out.")
+        else:
+            print(f"{ttl:2}  {hosts[src]} [{src}]")
+
+    if final_hop is not None:
+        print(f"\nDestination {target} reached in {final_hop} hops.\n")
 
 def traceroute_scapy(target, max_hops=30, timeout=2):
     print(f"\nTraceroute to {target}, max hops: {max_hops}...\n")
-    
+
+    # Resolve the target once up front - passing the hostname to IP(dst=...)
+    # would redo the DNS lookup for every probe built.
+    dst_ip = resolve(target)
+
+    # Send every TTL probe in one burst instead of blocking on sr1 per hop;
+    # wall-clock drops from O(max_hops * timeout) to roughly one timeout.
+    # The probes differ only in TTL and id, so build one template packet
+    # and copy it instead of re-running scapy's layer init per hop.
+    base = IP(dst=dst_ip) / ICMP()
+    probes = []
+    for ttl in range(1, max_hops + 1):
+        probe = base.copy()
+        probe[IP].ttl = ttl
+        probe[ICMP].id = ttl
+        probes.append(probe)
+    answered, _ = sr(probes, verbose=0, timeout=timeout)
+
+    # Match replies back to their hop by the TTL of the probe that drew them
+    replies = {sent.ttl: reply for sent, reply in answered}
+
+    # The first Echo Reply (type 0) marks the destination; later TTLs also
+    # reach it and answer, so cut the listing off there. Peek the ICMP type
+    # byte straight out of the raw reply - touching reply.type would make
+    # scapy dissect every layer just to read that one field.
+    final_hop = None
     for ttl in range(1, max_hops + 1):
-        pkt = IP(dst=target, ttl=ttl) / ICMP()
-        reply = sr1(pkt, verbose=0, timeout=timeout)
-        
+        reply = replies.get(ttl)
+        if reply is None:
+            continue
+        raw = bytes(reply)
+        if raw[(raw[0] & 0x0F) * 4] == 0:
+            final_hop = ttl
+            break
+
+    last_hop = final_hop or max_hops
+
+    # Resolve every hop address in parallel - each gethostbyaddr can block
+    # for seconds, so serial lookups would dominate the trace wall-clock.
+    addrs = {replies[ttl].src for ttl in range(1, last_hop + 1) if ttl in replies}
+    if addrs:
+        # Cap each PTR query - a hung resolver shouldn't stall the listing
+        socket.setdefaulttimeout(1.0)
+        with ThreadPoolExecutor(max_workers=len(addrs)) as pool:
+            hosts = dict(zip(addrs, pool.map(_reverse_lookup, addrs)))
+    else:
+        hosts = {}
+
+    for ttl in range(1, last_hop + 1):
+        reply = replies.get(ttl)
+
         if reply is None:
             print(f"{ttl:2}  * * * Request timed out.")
         else:
-            try:
-                host = socket.gethostbyaddr(reply.src)[0]
-            except socket.herror:
-                host = reply.src
-
-            print(f"{ttl:2}  {host} [{reply.src}]")
+            print(f"{ttl:2}  {hosts[reply.src]} [{reply.src}]")
 
-            if reply.type == 0:  # Echo Reply (destination reached)
-                print(f"\nDestination {target} reached in {ttl} hops.\n")
-                break
+    if final_hop is not None:
+        print(f"\nDestination {target} reached in {final_hop} hops.\n")
 
 if __name__ == "__main__":
-    traceroute_scapy("8.8.8.8")  # Example target")
+    try:
+        traceroute_raw("8.8.8.8")  # Example target
+    except (PermissionError, OSError):
+        # Raw sockets unavailable - use the scapy implementation
+        traceroute_scapy("8.8.8.8")
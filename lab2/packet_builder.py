@@ -1,4 +1,30 @@
 from scapy.all import IP, ICMP
+import socket
+import time
+
+# Hostname -> (address, resolve time) cache so repeated packet builds
+# don't redo a DNS round-trip inside IP(dst=...)
+_RESOLVE_TTL = 300  # seconds a cached lookup stays valid
+_RESOLVED = {}
+
+def resolve(host):
+    """
+    Resolves a hostname to an IP address, caching the result.
+
+    Args:
+        host: Hostname or IP literal (literals pass through unchanged).
+
+    Returns:
+        The resolved IP address as a string.
+    """
+    now = time.monotonic()
+    entry = _RESOLVED.get(host)
+    if entry is not None and now - entry[1] < _RESOLVE_TTL:
+        return entry[0]
+
+    addr = socket.gethostbyname(host)
+    _RESOLVED[host] = (addr, now)
+    return addr
 
 def build_packet(dst_ip="google.com", payload="HELLO"):
     """
@@ -11,5 +37,7 @@ def build_packet(dst_ip="google.com", payload="HELLO"):
     Returns:
         The constructed packet.
     """
-    pkt = IP(dst=dst_ip) / ICMP() / payload
-    return pkt
\ No newline at end of file
+    # Resolve up front (cached) so scapy gets an IP literal and never
+    # triggers its own DNS lookup per packet construction
+    pkt = IP(dst=resolve(dst_ip)) / ICMP() / payload
+    return pkt
@@ -1,4 +1,45 @@
-from scapy.all import sniff
+from scapy.all import sniff, conf
+
+def enable_immediate_mode():
+    """
+    Enables libpcap immediate mode for scapy captures.
+
+    By default libpcap buffers packets for up to the read timeout before
+    delivering them to user space, which can delay captured packets by
+    several seconds. Immediate mode makes the kernel hand each packet
+    over as soon as it is copied.
+
+    scapy's libpcap wrapper calls pcap_set_timeout() exactly once per
+    handle between pcap_create() and pcap_activate(), so we hook that
+    call to flip immediate mode on the same handle at the right moment.
+
+    Returns:
+        True if immediate mode could be enabled, False otherwise
+        (e.g. libpcap is not installed - capture still works, buffered).
+    """
+    conf.use_pcap = True
+    try:
+        from scapy.libs import winpcapy  # ctypes bindings behind conf.use_pcap
+    except (ImportError, OSError):
+        return False
+
+    if getattr(winpcapy.pcap_set_timeout, "_immediate_mode", False):
+        return True  # already patched
+
+    try:
+        set_immediate = winpcapy._lib.pcap_set_immediate_mode
+    except AttributeError:
+        return False  # libpcap too old for immediate mode
+
+    original_set_timeout = winpcapy.pcap_set_timeout
+
+    def set_timeout_with_immediate(handle, to_ms):
+        set_immediate(handle, 1)
+        return original_set_timeout(handle, to_ms)
+
+    set_timeout_with_immediate._immediate_mode = True
+    winpcapy.pcap_set_timeout = set_timeout_with_immediate
+    return True
 
 def sniff_icmp(count=5):
     """
@@ -10,6 +51,7 @@ def sniff_icmp(count=5):
     Returns:
         A list of captured packets.
     """
+    enable_immediate_mode()
     print(f"Sniffing {count} ICMP packets...")
     packets = sniff(filter="icmp", count=count, prn=lambda pkt: pkt.summary())
-    return packets
\ No newline at end of file
+    return packets
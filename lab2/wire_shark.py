@@ -1,5 +1,8 @@
-from scapy.all import sniff, IP, ICMP
+from scapy.all import AsyncSniffer, IP, ICMP
+from collections import deque
 from datetime import datetime
+from packet_sniffer import enable_immediate_mode
+import time
 
 def format_packet(pkt):
     """Format packet into displayable info."""
@@ -11,14 +14,41 @@ def format_packet(pkt):
 
 def simple_sniffer(count=5):
     print(f"\n[+] Sniffing {count} ICMP packets...\n")
-    packets = sniff(filter="icmp", count=count)
+
+    # Prefer libpcap-driven capture when available; the "icmp" BPF filter
+    # then runs kernel-side, and immediate mode delivers each packet as
+    # soon as the kernel copies it instead of after the buffering timeout.
+    enable_immediate_mode()
+
+    # AsyncSniffer captures on a background thread and hands packets over
+    # through a thread-safe deque, so slow display work in this thread
+    # cannot stall the capture loop and drop packets.
+    captured = deque()
+    sniffer = AsyncSniffer(filter="icmp", store=False,
+                           prn=captured.append, count=count)
+    sniffer.start()
 
     print(" ID |    Time    |     Source      ->    Destination   | Payload")
     print("----+------------+-----------------+-------------------+--------")
 
-    for i, pkt in enumerate(packets):
+    packets = []
+    # Key on the thread itself, not sniffer.running: running flips to True
+    # only once the thread enters _run (so checking it right after start()
+    # races and can exit the loop before capture begins) and stays True if
+    # the thread dies during socket setup - which would spin this loop
+    # forever and never reach the join() that re-raises the stored error.
+    while len(packets) < count and (sniffer.thread.is_alive() or captured):
+        if not captured:
+            time.sleep(0.01)
+            continue
+        pkt = captured.popleft()
         timestamp, src, dst, payload = format_packet(pkt)
-        print(f" {i:2} | {timestamp} | {src:15} -> {dst:15} | {payload[:20]}")
+        print(f" {len(packets):2} | {timestamp} | {src:15} -> {dst:15} | {payload[:20]}")
+        packets.append(pkt)
+
+    # Re-raises any exception the capture thread recorded (e.g. a failed
+    # socket/filter setup), instead of silently showing an empty capture
+    sniffer.join()
 
     print("\nEnter packet ID to see full details or 'q' to quit:")
     while True:
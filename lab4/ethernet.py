@@ -12,141 +12,208 @@ The simulation visualizes:
 - Real-time network state visualization
 """
 
-from copy import copy
+import io
 import random
+import sys
 import time
 
+import numpy as np
+
 # Configuration constants
 ETHERNET_CABLE_LENGHT = 20  # Length of the Ethernet cable in segments
 
-class CableCell:
+# Sentinel for a collision in a cable nibble, rendered as '#'
+COLLISION = 0xF
+
+def signal_id(name):
+    """
+    Map a device name ('A', 'B', ...) to its numeric signal id (1, 2, ...).
+
+    Args:
+        name (str): Single-letter device identifier
+
+    Returns:
+        int: Positive signal id stored in the cable nibbles (max 14)
+    """
+    return ord(name) - ord('A') + 1
+
+def signal_char(sid):
+    """
+    Map a numeric signal id back to its display character.
+
+    Args:
+        sid (int): Signal id from a cable nibble (COLLISION for '#')
+
+    Returns:
+        str: Device letter or '#' for a collision
     """
-    Represents a single segment of the Ethernet cable.
-    
-    Each cell can carry signals from left and right directions.
-    Collisions are detected when signals from both directions meet.
-    
+    return '#' if sid == COLLISION else chr(sid + ord('A') - 1)
+
+def _build_display_table():
+    """
+    Build the byte -> display character translation table.
+
+    Every possible packed cell value (256 of them) maps to its display
+    character once, so rendering the cable is a single bytes.translate
+    over the packed array instead of per-cell Python logic.
+
+    Returns:
+        bytes: 256-entry table for bytes.translate
+    """
+    table = bytearray(256)
+    for cell in range(256):
+        left, right = cell & 0x0F, cell >> 4
+        if left == 0 and right == 0:
+            table[cell] = ord('_')
+        else:
+            table[cell] = ord(signal_char(right if left == 0 else left))
+    return bytes(table)
+
+_DISPLAY_TABLE = _build_display_table()
+
+class Cable:
+    """
+    Represents the shared Ethernet cable as one packed NumPy array.
+
+    Each segment is a single uint8: the low nibble holds the
+    left-travelling signal and the high nibble the right-travelling
+    one (0 = empty, 1-14 = device signal id, 0xF = collision '#').
+    The whole cable is one byte per cell - it fits in a cache line
+    for typical lengths - and a propagation step is a handful of
+    vectorized shifts and compares on the unpacked nibbles.
+
     Attributes:
-        pos (int): Position of this cell in the cable
-        left (str|None): Signal coming from the left direction
-        right (str|None): Signal coming from the right direction
+        length (int): Number of cable segments
+        cells (np.ndarray): Packed uint8 cable state
     """
-    
-    def __init__(self, _pos_):
+
+    def __init__(self, length=ETHERNET_CABLE_LENGHT):
         """
-        Initialize a cable cell at the given position.
-        
+        Initialize an idle cable of the given length.
+
         Args:
-            _pos_ (int): Position of this cell in the cable (0-based index)
+            length (int): Number of segments in the cable
         """
-        self.pos = _pos_
-        self.left = None   # Signal from left direction
-        self.right = None  # Signal from right direction
+        self.length = length
+        self.cells = np.zeros(length, dtype=np.uint8)
 
-    def new_signal(self, signal):
+    def new_signal(self, pos, sid):
         """
-        Inject a new signal into this cable cell.
-        
+        Inject a new signal into the cable at the given position.
+
         The signal propagates in both directions. If there's already
-        a signal present, a collision ('#') is marked.
-        
+        a signal present, a collision is marked.
+
         Args:
-            signal (str): The signal to inject (typically device name like 'A', 'B', 'C')
+            pos (int): Cable position to transmit on
+            sid (int): Signal id of the transmitting device
         """
-        self.left = signal if self.left == None else '#'
-        self.right = signal if self.right == None else '#'
+        cell = self.cells[pos]
+        left = sid if (cell & 0x0F) == 0 else COLLISION
+        right = sid if (cell >> 4) == 0 else COLLISION
+        self.cells[pos] = (right << 4) | left
 
-    def propagate(self, cable, new_cable):
+    def is_idle(self, pos):
         """
-        Propagate signals to neighboring cells in the next time step.
-        
-        This method implements the core signal propagation logic:
-        - Signals move from one cell to adjacent cells
-        - Collisions are detected when signals meet
-        - Collision markers ('#') are propagated
-        
+        Check whether a cable position carries no signal at all.
+
         Args:
-            cable (list): Current state of the cable
-            new_cable (list): Next state of the cable to be updated
+            pos (int): Cable position to sense
+
+        Returns:
+            bool: True if neither direction carries a signal
         """
-        new_self = new_cable[self.pos]
-
-        # Handle left neighbor propagation
-        if self.pos != 0:  # Have left neighbor
-            left = cable[self.pos-1]
-            new_left = new_cable[self.pos-1]
-            if self.left != None and left.right != None:
-                # Collision: signals meeting from both directions
-                new_left.left = '#'
-                new_self.right = '#'
-            elif left.right != None:
-                # Signal coming from left neighbor
-                new_self.right = left.right
-            elif self.left != None:
-                # Signal going to left neighbor
-                new_left.left = self.left
-        
-        # Handle right neighbor propagation
-        if self.pos != ETHERNET_CABLE_LENGHT - 1:  # Have right neighbor
-            right = cable[self.pos+1]
-            new_right = new_cable[self.pos+1]
-            if self.right != None and right.left != None:
-                # Collision: signals meeting from both directions
-                new_right.right = '#'
-                new_self.left = '#'
-            elif right.left != None:
-                # Signal coming from right neighbor
-                new_self.left = right.left
-            elif self.right != None:
-                # Signal going to right neighbor
-                new_right.right = self.right
-        
-        # Handle collision in current cell
-        if new_self.left != None and new_self.right != None:
-            new_self.left = '#'
-            new_self.right = '#'
-    
-    def __str__(self):
+        return self.cells[pos] == 0
+
+    def has_collision(self, pos):
         """
-        Return visual representation of the cable cell state.
-        
+        Check whether a collision marker is present at a position.
+
+        Args:
+            pos (int): Cable position to sense
+
         Returns:
-            str: '_' for empty cell, signal character for active transmission,
-                 or the signal from right direction if left is empty
+            bool: True if either nibble carries a collision marker
+        """
+        cell = self.cells[pos]
+        return (cell & 0x0F) == COLLISION or (cell >> 4) == COLLISION
+
+    def propagate(self):
+        """
+        Advance every signal by one segment in a single vectorized update.
+
+        This replaces the per-cell propagate() of the old CableCell list:
+        - right-moving signals shift one cell right, left-moving one left
+          (signals fall off at the cable ends)
+        - signals crossing between adjacent cells collide and the '#'
+          markers keep travelling outward
+        - a cell occupied in both directions becomes a collision
         """
-        if self.left == None and self.right == None:
-            return '_'  # Empty cell
-        return self.right if self.left == None else self.left
-    
+        left = self.cells & 0x0F
+        right = self.cells >> 4
+        new_left = np.zeros_like(left)
+        new_right = np.zeros_like(right)
+
+        # Shift signals by one segment in their travel direction
+        new_right[1:] = right[:-1]
+        new_left[:-1] = left[1:]
+
+        # Collisions: signals meeting between adjacent cells propagate
+        # outward as '#' markers, exactly like the per-cell version
+        meet = (right[:-1] != 0) & (left[1:] != 0)
+        new_right[1:][meet] = COLLISION
+        new_left[:-1][meet] = COLLISION
+
+        # A cell occupied from both directions is a collision as well.
+        # Only the right-travelling slot is marked: in the old per-cell
+        # update the left slot was rewritten by the neighbour's pass right
+        # after the check, so its marker never survived a round.
+        both = (new_left != 0) & (new_right != 0)
+        new_right[both] = COLLISION
+
+        self.cells = (new_right << 4) | new_left
+
+    def render(self):
+        """
+        Return the visual representation of the whole cable.
+
+        Returns:
+            str: One character per segment - '_' for empty, device letter
+                 for an active signal, '#' for a collision
+        """
+        return self.cells.tobytes().translate(_DISPLAY_TABLE).decode('ascii')
+
 class Transmission:
     """
     Represents a data transmission from a device.
-    
+
     Implements CSMA/CD behavior including:
     - Carrier sense (checking if medium is free)
     - Collision detection
     - Exponential backoff algorithm
     - Packet transmission tracking
-    
+
     Attributes:
         src (str): Source device identifier (e.g., 'A', 'B', 'C')
+        sid (int): Numeric signal id injected into the cable arrays
         pos (int): Position of the transmitting device on the cable
         len (int): Total length of the packet to transmit
         left (int): Remaining bits to transmit
         wait (int): Time to wait to ensure no collisions occurred
         sleep (int): Backoff time after a collision
     """
-    
+
     def __init__(self, _src_, _pos_, _len_):
         """
         Initialize a new transmission.
-        
+
         Args:
             _src_ (str): Source device identifier
             _pos_ (int): Position on the cable where transmission starts
             _len_ (int): Length of the packet in time units
         """
         self.src = _src_                        # Device identifier (A, B, C)
+        self.sid = signal_id(_src_)             # Numeric id used on the cable
         self.pos = _pos_                        # Position in the cable
         self.len = _len_                        # Total packet length
         self.left = _len_                       # Remaining bits to transmit
@@ -156,31 +223,31 @@ class Transmission:
     def transmit(self, cable):
         """
         Attempt to transmit data on the cable using CSMA/CD protocol.
-        
+
         The transmission process follows these steps:
         1. Check if still in backoff period (sleep > 0)
         2. Detect collisions (collision markers '#')
         3. If collision detected, enter exponential backoff
         4. If medium is clear, transmit one bit
         5. Wait for collision detection period after transmission
-        
+
         Args:
-            cable (list): Current state of the cable
-            
+            cable (Cable): The shared cable medium
+
         Returns:
             bool: True if transmission is complete, False otherwise
         """
         # Check if we're done waiting for collision detection
         if self.wait == 0:
             return True
-        
+
         # Handle backoff period after collision
         if self.sleep > 0:
             self.sleep -= 1
             return False
 
         # Detect collision at our position
-        if cable[self.pos].left == '#' or cable[self.pos].right == '#':
+        if cable.has_collision(self.pos):
             # Collision detected! Implement exponential backoff
             self.sleep = random.choice([1, 2]) * ETHERNET_CABLE_LENGHT
             self.wait = ETHERNET_CABLE_LENGHT
@@ -191,21 +258,21 @@ class Transmission:
         if self.left == 0:
             # Packet sent, now waiting to ensure no collisions
             self.wait -= 1
-        elif cable[self.pos].left == None and cable[self.pos].right == None:
+        elif cable.is_idle(self.pos):
             # Medium is clear, transmit one bit
-            cable[self.pos].new_signal(self.src)
+            cable.new_signal(self.pos, self.sid)
             self.left -= 1
-        
+
         return False
 
 class Device:
     """
     Represents a network device connected to the Ethernet cable.
-    
+
     Each device has a schedule of transmissions and manages its own
     transmission queue. Devices implement CSMA/CD protocol for
     media access control.
-    
+
     Attributes:
         name (str): Device identifier (e.g., 'A', 'B', 'C')
         pos (int): Physical position on the cable
@@ -213,11 +280,11 @@ class Device:
         transmission (Transmission|None): Currently active transmission
         transmissions (list): Queue of scheduled transmissions
     """
-    
+
     def __init__(self, _name_, _pos_, _rounds_):
         """
         Initialize a network device.
-        
+
         Args:
             _name_ (str): Device identifier
             _pos_ (int): Position on the cable (0-based index)
@@ -229,22 +296,22 @@ class Device:
         self.transmission = None
         # Create transmission queue with random packet lengths
         self.transmissions = [
-            [r, Transmission(_name_, _pos_, random.randint(5, 10))] 
+            [r, Transmission(_name_, _pos_, random.randint(5, 10))]
             for r in _rounds_
         ]
-    
+
     def refresh(self, cable):
         """
         Update device state for the current simulation round.
-        
+
         This method:
         1. Increments the round counter
         2. Continues any active transmission
         3. Starts new transmissions when scheduled
-        
+
         Args:
-            cable (list): Current state of the cable
-            
+            cable (Cable): The shared cable medium
+
         Returns:
             bool: True if device has more activity, False if done
         """
@@ -258,7 +325,7 @@ class Device:
                 self.transmission = None
             else:
                 return True  # Still transmitting
-        
+
         # Check for new scheduled transmissions
         if self.transmissions:
             r, t = self.transmissions[0]
@@ -277,23 +344,49 @@ class Device:
         """Return device identifier for display."""
         return self.name
 
-def main():
+def main(fast=False):
     """
     Main simulation function.
-    
+
     Sets up the Ethernet network simulation with:
     - A cable of specified length
     - Multiple devices with transmission schedules
     - Real-time visualization of network state
+
+    Args:
+        fast (bool): Skip the pacing sleep and buffer all output,
+                     flushing it once at the end. For benchmarking
+                     runs where the animation is not needed.
+    """
+    # In fast mode everything is written into one in-memory buffer and
+    # flushed with a single write at the end, instead of one syscall-heavy
+    # print per line per round.
+    buffer = io.StringIO() if fast else None
+    if buffer is not None:
+        stdout, sys.stdout = sys.stdout, buffer
+
+    try:
+        _run_simulation(fast)
+    finally:
+        if buffer is not None:
+            sys.stdout = stdout
+            sys.stdout.write(buffer.getvalue())
+
+def _run_simulation(fast):
+    """
+    Run the simulation loop (output goes to whatever sys.stdout is).
+
+    Args:
+        fast (bool): Disables the 100 ms pacing sleep between rounds
     """
     print("🌐 Starting Ethernet CSMA/CD Simulation")
     print("=" * 50)
     print(f"Cable length: {ETHERNET_CABLE_LENGHT} segments")
     print("Legend: _ = empty, A/B/C = device signal, # = collision")
     print("=" * 50)
-    
+
     # Initialize the cable
-    cable = [CableCell(i) for i in range(ETHERNET_CABLE_LENGHT)]
+    cable = Cable(ETHERNET_CABLE_LENGHT)
 
     # Create devices with their transmission schedules
     devices = [
@@ -301,7 +394,7 @@ def main():
         Device('B', 9, [50]),           # Device B at position 9
         Device('C', 15, [55, 60, 80])   # Device C at position 15
     ]
-    
+
     print(f"📱 Devices configured:")
     for dev in devices:
         schedule = [t[0] for t in dev.transmissions]
@@ -314,24 +407,22 @@ def main():
         current_round += 1
 
         # Propagate signals through the cable
-        new_cable = [CableCell(i) for i in range(ETHERNET_CABLE_LENGHT)]
-        for cell in cable:
-            cell.propagate(cable, new_cable)
-        cable = new_cable
-        
+        cable.propagate()
+
         # Update all devices
         print(f"🔄 ROUND {current_round}")
         devices = [d for d in devices if d.refresh(cable)]
 
-        # Visualize current state
-        print("   Cable: " + "".join([str(cell) for cell in cable]))
+        # Visualize current state - built as a list of lines and emitted
+        # with one write instead of one print per line
+        lines = ["   Cable: " + cable.render()]
 
         # Show device positions
         device_line = [' '] * ETHERNET_CABLE_LENGHT
         for dev in devices:
             device_line[dev.pos] = str(dev)
-        print("   Devs:  " + "".join(device_line))
-        
+        lines.append("   Devs:  " + "".join(device_line))
+
         # Show active transmissions
         active_transmissions = [d for d in devices if d.transmission is not None]
         if active_transmissions:
@@ -345,12 +436,13 @@ def main():
                 else:
                     status = f"waiting for collision detection ({t.wait} rounds)"
                 transmission_info.append(f"{d.name}: {status}")
-            print("   Status: " + " | ".join(transmission_info))
-        
-        print()
-        time.sleep(0.1)
-    
+            lines.append("   Status: " + " | ".join(transmission_info))
+
+        sys.stdout.write('\n'.join(lines) + '\n\n')
+        if not fast:
+            time.sleep(0.1)
+
     print("✅ Simulation completed - all devices finished their transmissions")
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main(fast='--fast' in sys.argv[1:])
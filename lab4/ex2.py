@@ -4,56 +4,232 @@
 import random
 import time
 import sys
+from collections import deque
 from typing import List, Dict, Optional, Tuple
-from enum import Enum
+from enum import IntEnum
 import threading
 
-class SignalType(Enum):
+import numpy as np
+
+# Opcjonalna kompilacja gorącej pętli propagacji (Numba);
+# bez numby działa wektorowa ścieżka NumPy
+try:
+    from numba import njit as _njit
+except ImportError:
+    _njit = None
+
+class SignalType(IntEnum):
     IDLE = 0
     DATA = 1
-    COLLISION = 2
-    JAM = 3
+    JAM = 2
+    COLLISION = 3  # DATA | JAM - oba bity naraz
+
+# Kody sygnałów jako zwykłe inty - porównania w gorących pętlach (i kod
+# pod numbą) pracują na czystych intach, bez narzutu obiektów IntEnum
+IDLE = int(SignalType.IDLE)
+DATA = int(SignalType.DATA)
+JAM = int(SignalType.JAM)
+COLLISION = int(SignalType.COLLISION)
+
+if _njit is not None:
+    @_njit(cache=True, boundscheck=False)
+    def _propagate_cells(cable, out, d, tx_val, tx_cnt):
+        """Jedno przejście po kablu: scala sygnały z i-d, i, i+d i nadajników.
+
+        Zamiast kilku przebiegów NumPy (przesunięcia, zliczanie, where)
+        liczy każdą komórkę w jednej pętli bez tablic tymczasowych.
+        """
+        n = cable.shape[0]
+        for i in range(n):
+            # Scalanie bez rozgałęzień: OR kumuluje bity sygnałów, a liczbę
+            # źródeł liczy arytmetyka na boolach. Samo v & (v-1) nie
+            # wystarczy do wykrycia kolizji - dwa sygnały tego samego typu
+            # (np. dwie ramki DATA) ORują się do jednego bitu, a wciąż są
+            # kolizją, więc licznik źródeł zostaje
+            a = cable[i - d] if i - d >= 0 else 0
+            b = cable[i]
+            c = cable[i + d] if i + d < n else 0
+            v = a | b | c | tx_val[i]
+            cnt = (a != IDLE) + (b != IDLE) + (c != IDLE) + tx_cnt[i]
+            out[i] = COLLISION if cnt > 1 else v
+
+class NodeState(IntEnum):
+    IDLE = 0
+    LISTENING = 1
+    TRANSMITTING = 2
+    COLLISION_DETECTED = 3
+    BACKOFF = 4
+    JAMMING = 5
+
+# Etykiety stanów do wyświetlania, indeksowane wartością NodeState
+NODE_STATE_LABELS = ("IDLE", "LISTENING", "TRANSMITTING",
+                     "COLLISION", "BACKOFF", "JAMMING")
+
+# Wartości stanów jako zwykłe inty - kod pod numbą nie rozumie IntEnum
+ST_IDLE = int(NodeState.IDLE)
+ST_LISTENING = int(NodeState.LISTENING)
+ST_TRANSMITTING = int(NodeState.TRANSMITTING)
+ST_BACKOFF = int(NodeState.BACKOFF)
+ST_JAMMING = int(NodeState.JAMMING)
+
+# Pojemność kolejki ramek per węzeł (ruch losowy i tak ogranicza ją do 5)
+QUEUE_CAPACITY = 16
+
+if _njit is not None:
+    @_njit(cache=True)
+    def _simulate_steps(cable, cable_buf, tx_val, tx_cnt, d, positions,
+                        state, tx_time, backoff_time, collision_count,
+                        jam_duration, successful_tx, total_attempts,
+                        current_len, queue, queue_head, queue_len,
+                        traffic_ok, frame_lens, stats, slot_time,
+                        start, n_steps):
+        """Wykonuje n_steps kroków symulacji w całości w kodzie natywnym.
+
+        Ruch losowy jest rozstrzygnięty z góry (traffic_ok/frame_lens),
+        kolejki ramek to bufory cykliczne w tablicy queue, a statystyki
+        lądują w stats = [próby, udane, kolizje]. Dzięki temu cała pętla
+        kroków biegnie bez powrotu do interpretera.
+        """
+        n = cable.shape[0]
+        num_nodes = positions.shape[0]
+        qmax = queue.shape[1]
+
+        # Liczniki zajętych węzłów i zakolejkowanych ramek - gdy oba są
+        # zerem, a kabel pusty, krok nie ma czego liczyć
+        busy = 0
+        queued = 0
+        for i in range(num_nodes):
+            if state[i] != ST_IDLE:
+                busy += 1
+            queued += queue_len[i]
+
+        for s in range(start, start + n_steps):
+            # --- losowy ruch: decyzje wylosowane przed pętlą ---
+            for i in range(num_nodes):
+                if traffic_ok[s, i] and queue_len[i] < 5:
+                    queue[i, (queue_head[i] + queue_len[i]) % qmax] = frame_lens[s, i]
+                    queue_len[i] += 1
+                    queued += 1
 
-class NodeState(Enum):
-    IDLE = "IDLE"
-    LISTENING = "LISTENING"
-    TRANSMITTING = "TRANSMITTING"
-    COLLISION_DETECTED = "COLLISION"
-    BACKOFF = "BACKOFF"
-    JAMMING = "JAMMING"
+            # --- pusty krok: nikt nie nadaje, nic nie czeka, kabel czysty ---
+            if busy == 0 and queued == 0:
+                cable_clear = True
+                for i in range(n):
+                    if cable[i] != IDLE:
+                        cable_clear = False
+                        break
+                if cable_clear:
+                    continue
+
+            # --- propagacja sygnału ---
+            for i in range(n):
+                tx_val[i] = 0
+                tx_cnt[i] = 0
+            for i in range(num_nodes):
+                if state[i] == ST_TRANSMITTING:
+                    tx_val[positions[i]] |= DATA
+                    tx_cnt[positions[i]] += 1
+                elif state[i] == ST_JAMMING:
+                    tx_val[positions[i]] |= JAM
+                    tx_cnt[positions[i]] += 1
+            _propagate_cells(cable, cable_buf, d, tx_val, tx_cnt)
+            cable[:] = cable_buf
+
+            # --- przejścia stanów węzłów ---
+            for i in range(num_nodes):
+                st = state[i]
+                cell = cable[positions[i]]
+
+                if st == ST_IDLE or st == ST_LISTENING:
+                    if queue_len[i] > 0 or st == ST_LISTENING:
+                        if cell == IDLE:
+                            # Medium wolne - zdejmij ramkę i nadawaj
+                            h = queue_head[i]
+                            current_len[i] = queue[i, h]
+                            queue_head[i] = (h + 1) % qmax
+                            queue_len[i] -= 1
+                            queued -= 1
+                            if st == ST_IDLE:
+                                busy += 1
+                            state[i] = ST_TRANSMITTING
+                            tx_time[i] = current_len[i]
+                            total_attempts[i] += 1
+                            stats[0] += 1
+                        elif st == ST_IDLE:
+                            # Medium zajęte - czekaj
+                            state[i] = ST_LISTENING
+                            busy += 1
+
+                elif st == ST_TRANSMITTING:
+                    if cell == COLLISION:
+                        # Wykryto kolizję - JAM i zwrot ramki do kolejki
+                        state[i] = ST_JAMMING
+                        jam_duration[i] = 5
+                        collision_count[i] += 1
+                        h = (queue_head[i] - 1) % qmax
+                        queue[i, h] = current_len[i]
+                        queue_head[i] = h
+                        queue_len[i] += 1
+                        queued += 1
+                        stats[2] += 1
+                    else:
+                        tx_time[i] -= 1
+                        if tx_time[i] <= 0:
+                            # Transmisja zakończona pomyślnie
+                            state[i] = ST_IDLE
+                            busy -= 1
+                            collision_count[i] = 0
+                            successful_tx[i] += 1
+                            stats[1] += 1
+
+                elif st == ST_JAMMING:
+                    jam_duration[i] -= 1
+                    if jam_duration[i] <= 0:
+                        # Koniec sygnału JAM - losuj backoff (BEB)
+                        state[i] = ST_BACKOFF
+                        if collision_count[i] > 10:
+                            collision_count[i] = 10
+                        k = collision_count[i]
+                        if k > 0:
+                            slots = np.random.randint(0, 1 << k)
+                        else:
+                            slots = 0
+                        backoff_time[i] = slots * slot_time
+
+                elif st == ST_BACKOFF:
+                    backoff_time[i] -= 1
+                    if backoff_time[i] <= 0:
+                        state[i] = ST_IDLE
+                        busy -= 1
 
 class EthernetNode:
+    """Kolejka ramek i API węzła; gorące pola per krok (stan, liczniki)
+    trzyma symulator w równoległych tablicach NumPy."""
+
     def __init__(self, node_id: int, position: int):
         self.node_id = node_id
         self.position = position
-        self.state = NodeState.IDLE
-        self.data_to_send = []
-        self.current_frame = None
-        self.transmission_time = 0
-        self.backoff_time = 0
-        self.collision_count = 0
-        self.successful_transmissions = 0
-        self.total_attempts = 0
-        self.jam_duration = 0
-        
+        # deque: zdjęcie z przodu i zwrot ramki po kolizji są O(1),
+        # na liście obie operacje przesuwałyby całą zawartość
+        self.data_to_send = deque()
+
     def has_data_to_send(self) -> bool:
         return len(self.data_to_send) > 0
-    
+
     def add_data(self, frame_data: str):
         self.data_to_send.append(frame_data)
-    
-    def calculate_backoff(self) -> int:
-        """Oblicza czas backoff używając Binary Exponential Backoff"""
-        if self.collision_count > 10:
-            self.collision_count = 10  # Maksymalnie 2^10 slotów
-        
-        max_slots = 2 ** self.collision_count
-        return random.randint(0, max_slots - 1)
+
+    def calculate_backoff(self, collision_count: int) -> int:
+        """Oblicza liczbę slotów backoff używając Binary Exponential Backoff"""
+        # randint schodzi w _randbelow z samplowaniem odrzucającym; dla
+        # zakresu 2^k getrandbits(k) daje ten sam rozkład jednym wywołaniem
+        k = collision_count if collision_count < 10 else 10  # Maksymalnie 2^10 slotów
+        return random.getrandbits(k) if k else 0
 
 class EthernetSimulator:
     def __init__(self, cable_length: int = 100, num_nodes: int = 4, 
                  propagation_delay: int = 1, slot_time: int = 10):
-        self.cable = [SignalType.IDLE] * cable_length
+        self.cable = np.zeros(cable_length, dtype=np.uint8)
         self.cable_length = cable_length
         self.propagation_delay = propagation_delay
         self.slot_time = slot_time
@@ -71,166 +247,373 @@ class EthernetSimulator:
         for i in range(num_nodes):
             node = EthernetNode(i, positions[i])
             self.nodes.append(node)
+
+        # Pozycje węzłów w jednej tablicy - wstrzykiwanie sygnałów i odczyt
+        # medium pod węzłami indeksują nią kabel zamiast pętli po obiektach
+        self.node_positions = np.array(positions, dtype=np.intp)
+
+        # Gorące pola węzłów jako tablice SoA (struktura tablic) - przejścia
+        # stanów robią się maskami zamiast dereferencji atrybutów per węzeł
+        self.node_state = np.zeros(num_nodes, dtype=np.int8)
+        self.tx_time = np.zeros(num_nodes, dtype=np.int32)
+        self.backoff_time = np.zeros(num_nodes, dtype=np.int32)
+        self.collision_count = np.zeros(num_nodes, dtype=np.int32)
+        self.jam_duration = np.zeros(num_nodes, dtype=np.int32)
+        self.successful_tx = np.zeros(num_nodes, dtype=np.int64)
+        self.total_attempts = np.zeros(num_nodes, dtype=np.int64)
+        # Długość ramki aktualnie nadawanej przez każdy węzeł (do zwrotu
+        # po kolizji); w symulacji liczy się tylko długość ramki
+        self.current_len = np.zeros(num_nodes, dtype=np.int32)
+
+        # Kolejki ramek jako bufory cykliczne (długości ramek) - wspólna
+        # reprezentacja dla ścieżki skompilowanej i interpretowanej;
+        # deque w EthernetNode służy tylko do zbierania ramek przed startem
+        self.queue = np.zeros((num_nodes, QUEUE_CAPACITY), dtype=np.int32)
+        self.queue_head = np.zeros(num_nodes, dtype=np.int32)
+        self.queue_len = np.zeros(num_nodes, dtype=np.int32)
+        # Statystyki dla ścieżki skompilowanej: [próby, udane, kolizje]
+        self._stats = np.zeros(3, dtype=np.int64)
+
+        # Liczniki O(1) do pomijania pustych kroków: węzły poza stanem IDLE
+        # i ramki czekające w kolejkach
+        self._busy_count = 0
+        self._queued_count = 0
+
+        # Obsada stanów: ile węzłów jest w każdym NodeState - bloki przejść
+        # w update_node_states dla pustych stanów można wtedy pominąć bez
+        # liczenia masek
+        self._state_count = np.zeros(len(NodeState), dtype=np.int64)
+        self._state_count[NodeState.IDLE] = num_nodes
+
+        # Drugi bufor kabla i bufory robocze propagacji alokowane raz -
+        # propagate_signal pisze do bufora i zamienia go z kablem zamiast
+        # alokować nową tablicę co krok
+        self._cable_buf = np.zeros(cable_length, dtype=np.uint8)
+        self._tx_val = np.zeros(cable_length, dtype=np.uint8)
+        self._tx_cnt = np.zeros(cable_length, dtype=np.uint8)
+        self._left = np.zeros(cable_length, dtype=np.uint8)
+        self._right = np.zeros(cable_length, dtype=np.uint8)
+
+        # Tablica translacji kod sygnału -> znak: cały kabel renderuje się
+        # jednym translate na bajtach zamiast if/elif per komórkę
+        self._disp_table = bytes.maketrans(
+            bytes([IDLE, DATA, JAM, COLLISION]), b'-DJX')
+        # Wiersz z pozycjami węzłów jest stały - składamy go raz
+        node_display = [' '] * cable_length
+        for node in self.nodes:
+            node_display[node.position] = str(node.node_id)
+        self._node_line = ''.join(node_display)
+
+        # Rozgrzej JIT na miniaturowym wejściu, żeby pierwszy krok symulacji
+        # nie płacił za kompilację (cache=True i tak trzyma wynik na dysku)
+        if _njit is not None:
+            u8 = np.zeros(1, dtype=np.uint8)
+            u8b = np.zeros(1, dtype=np.uint8)
+            _propagate_cells(u8, u8b, 1, u8, np.zeros(1, dtype=np.uint8))
+            i32 = np.zeros(1, dtype=np.int32)
+            _simulate_steps(
+                u8, u8b, np.zeros(1, dtype=np.uint8), np.zeros(1, dtype=np.uint8),
+                1, np.zeros(1, dtype=np.intp), np.zeros(1, dtype=np.int8),
+                i32.copy(), i32.copy(), i32.copy(), i32.copy(),
+                np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64),
+                i32.copy(), np.zeros((1, QUEUE_CAPACITY), dtype=np.int32),
+                i32.copy(), i32.copy(),
+                np.zeros((1, 1), dtype=np.bool_), np.zeros((1, 1), dtype=np.int32),
+                np.zeros(3, dtype=np.int64), 1, 0, 0)
     
     def sense_carrier(self, node: EthernetNode) -> bool:
         """Sprawdza czy medium jest wolne (Carrier Sense)"""
-        return self.cable[node.position] == SignalType.IDLE
-    
+        return self.cable[node.position] == IDLE
+
     def detect_collision(self, node: EthernetNode) -> bool:
         """Wykrywa kolizję na pozycji węzła (Collision Detection)"""
-        return self.cable[node.position] == SignalType.COLLISION
-    
+        return self.cable[node.position] == COLLISION
+
     def propagate_signal(self):
         """Symuluje propagację sygnału w medium"""
-        new_cable = [SignalType.IDLE] * self.cable_length
-        
-        for i in range(self.cable_length):
-            signals = []
-            
-            # Sprawdź sygnały z sąsiednich pozycji (propagacja)
-            for offset in [-self.propagation_delay, 0, self.propagation_delay]:
-                pos = i + offset
-                if 0 <= pos < self.cable_length:
-                    if self.cable[pos] != SignalType.IDLE:
-                        signals.append(self.cable[pos])
-            
-            # Sprawdź czy jakiś węzeł nadaje na tej pozycji
-            for node in self.nodes:
-                if node.position == i and node.state == NodeState.TRANSMITTING:
-                    signals.append(SignalType.DATA)
-                elif node.position == i and node.state == NodeState.JAMMING:
-                    signals.append(SignalType.JAM)
-            
-            # Ustal stan medium
-            if len(signals) == 0:
-                new_cable[i] = SignalType.IDLE
-            elif len(signals) == 1:
-                new_cable[i] = signals[0]
-            else:
-                # Kolizja - więcej niż jeden sygnał
-                new_cable[i] = SignalType.COLLISION
-        
-        self.cable = new_cable
+        cable = self.cable
+        n = self.cable_length
+        d = self.propagation_delay
+
+        # Nikt nie nadaje i kabel pusty - propagacja nic by nie zmieniła
+        if self._busy_count == 0 and not cable.any():
+            return
+
+        # Sygnały wstrzykiwane przez nadające węzły - mały wektor sygnałów
+        # rozrzucony po pozycjach (ufunc.at poprawnie kumuluje duplikaty);
+        # gdy żaden węzeł nie jest aktywny, nie ma czego rozrzucać
+        tx_val = self._tx_val
+        tx_cnt = self._tx_cnt
+        tx_val.fill(0)
+        tx_cnt.fill(0)
+        if self._busy_count:
+            states = self.node_state
+            tx_sig = np.where(
+                states == NodeState.TRANSMITTING, np.uint8(DATA),
+                np.where(states == NodeState.JAMMING, np.uint8(JAM),
+                         np.uint8(IDLE)))
+            np.bitwise_or.at(tx_val, self.node_positions, tx_sig)
+            np.add.at(tx_cnt, self.node_positions, (tx_sig != IDLE).astype(np.uint8))
+
+        # Wynik idzie do drugiego bufora, na końcu zamieniamy go z kablem
+        out = self._cable_buf
+
+        # Gorąca pętla w kodzie natywnym, jeśli numba jest dostępna
+        if _njit is not None:
+            _propagate_cells(cable, out, d, tx_val, tx_cnt)
+            self.cable, self._cable_buf = out, cable
+            return
+
+        # Ścieżka NumPy, przypadek d == 1 (domyślny): sąsiedzi to zwykłe
+        # wycinki cable[:-1] i cable[1:], więc OR-ujemy je wprost do bufora
+        # wyjściowego bez zerowania i kopiowania tablic pomocniczych
+        if d == 1 and n > 1:
+            count = tx_cnt
+            count += cable != IDLE
+            count[1:] += cable[:-1] != IDLE
+            count[:-1] += cable[1:] != IDLE
+
+            out[:] = cable
+            np.bitwise_or(out[1:], cable[:-1], out=out[1:])
+            np.bitwise_or(out[:-1], cable[1:], out=out[:-1])
+            np.bitwise_or(out, tx_val, out=out)
+            out[count > 1] = COLLISION
+
+            self.cable, self._cable_buf = out, cable
+            return
+
+        # Przypadek ogólny: sygnały z sąsiednich pozycji przez przesunięcia
+        # całej tablicy o d w obie strony (bez zawijania)
+        left = self._left
+        right = self._right
+        left.fill(0)
+        right.fill(0)
+        if d == 0:
+            left[:] = cable
+            right[:] = cable
+        elif d < n:
+            left[d:] = cable[:-d]    # sygnał idący od pozycji i-d
+            right[:-d] = cable[d:]   # sygnał idący od pozycji i+d
+
+        # Ustal stan medium: jeden sygnał przechodzi bez zmian (kody są
+        # maską bitową, więc OR go zachowuje), więcej niż jeden to kolizja;
+        # licznik źródeł kumulujemy w buforze nadajników
+        count = tx_cnt
+        count += left != IDLE
+        count += cable != IDLE
+        count += right != IDLE
+
+        np.bitwise_or(left, cable, out=out)
+        np.bitwise_or(out, right, out=out)
+        np.bitwise_or(out, tx_val, out=out)
+        out[count > 1] = COLLISION
+
+        self.cable, self._cable_buf = out, cable
     
+    def _enqueue(self, i: int, frame_len: int):
+        """Dokłada ramkę (jej długość) na koniec kolejki węzła i"""
+        if self.queue_len[i] >= QUEUE_CAPACITY:
+            return  # pełna kolejka - ramka przepada
+        slot = (self.queue_head[i] + self.queue_len[i]) % QUEUE_CAPACITY
+        self.queue[i, slot] = frame_len
+        self.queue_len[i] += 1
+        self._queued_count += 1
+
+    def _load_queues(self):
+        """Przenosi ramki zebrane w węzłach do kolejek symulacji"""
+        for i, node in enumerate(self.nodes):
+            while node.data_to_send:
+                self._enqueue(i, len(node.data_to_send.popleft()))
+
+    def _start_transmission(self, i: int):
+        """Zdejmuje ramkę z kolejki węzła i i rozpoczyna jej nadawanie"""
+        h = self.queue_head[i]
+        self.current_len[i] = self.queue[i, h]
+        self.queue_head[i] = (h + 1) % QUEUE_CAPACITY
+        self.queue_len[i] -= 1
+        self._queued_count -= 1
+        if self.node_state[i] == NodeState.IDLE:
+            self._busy_count += 1
+        self._state_count[self.node_state[i]] -= 1
+        self._state_count[NodeState.TRANSMITTING] += 1
+        self.node_state[i] = NodeState.TRANSMITTING
+        self.tx_time[i] = self.current_len[i]
+        self.total_attempts[i] += 1
+        self.statistics['total_transmissions'] += 1
+
     def update_node_states(self):
         """Aktualizuje stany wszystkich węzłów"""
-        for node in self.nodes:
-            if node.state == NodeState.IDLE:
-                if node.has_data_to_send():
-                    if self.sense_carrier(node):
-                        # Medium wolne - rozpocznij transmisję
-                        node.state = NodeState.TRANSMITTING
-                        node.current_frame = node.data_to_send.pop(0)
-                        node.transmission_time = len(node.current_frame)
-                        node.total_attempts += 1
-                        self.statistics['total_transmissions'] += 1
-                    else:
-                        # Medium zajęte - czekaj
-                        node.state = NodeState.LISTENING
-            
-            elif node.state == NodeState.LISTENING:
-                if self.sense_carrier(node):
-                    # Medium się zwolniło - spróbuj nadawać
-                    node.state = NodeState.TRANSMITTING
-                    node.current_frame = node.data_to_send.pop(0)
-                    node.transmission_time = len(node.current_frame)
-                    node.total_attempts += 1
-                    self.statistics['total_transmissions'] += 1
-            
-            elif node.state == NodeState.TRANSMITTING:
-                if self.detect_collision(node):
-                    # Wykryto kolizję - wyślij sygnał JAM
-                    node.state = NodeState.JAMMING
-                    node.jam_duration = 5  # Czas trwania sygnału JAM
-                    node.collision_count += 1
-                    node.data_to_send.insert(0, node.current_frame)  # Zwróć ramkę do kolejki
-                    self.statistics['collisions'] += 1
+        # Wszystkie węzły IDLE i puste kolejki - nie ma żadnych przejść
+        if self._busy_count == 0 and self._queued_count == 0:
+            return
+
+        # Obsada stanów sprzed przejść: blok stanu, którego nie zajmuje
+        # żaden węzeł, pomijamy bez liczenia masek po całej tablicy
+        sc = self._state_count
+        n_idle = int(sc[NodeState.IDLE])
+        n_listen = int(sc[NodeState.LISTENING])
+        n_tx = int(sc[NodeState.TRANSMITTING])
+        n_jam = int(sc[NodeState.JAMMING])
+        n_back = int(sc[NodeState.BACKOFF])
+
+        # Jeden wektorowy odczyt medium pod wszystkimi węzłami
+        at_nodes = self.cable[self.node_positions]
+        idle_here = at_nodes == IDLE
+        collision_here = at_nodes == COLLISION
+
+        states = self.node_state
+        st0 = states.copy()  # maski liczymy ze stanu sprzed przejść
+
+        # IDLE -> TRANSMITTING / LISTENING: start transmisji zdejmuje ramkę
+        # z kolejki, więc te przejścia robimy per indeks (krótkie pętle)
+        if n_idle and self._queued_count:
+            has_data = self.queue_len > 0
+            for i in np.nonzero((st0 == NodeState.IDLE) & has_data)[0]:
+                if idle_here[i]:
+                    # Medium wolne - rozpocznij transmisję
+                    self._start_transmission(i)
                 else:
-                    node.transmission_time -= 1
-                    if node.transmission_time <= 0:
-                        # Transmisja zakończona pomyślnie
-                        node.state = NodeState.IDLE
-                        node.collision_count = 0
-                        node.successful_transmissions += 1
-                        self.statistics['successful_transmissions'] += 1
-            
-            elif node.state == NodeState.JAMMING:
-                node.jam_duration -= 1
-                if node.jam_duration <= 0:
-                    # Zakończ sygnał JAM i przejdź do backoff
-                    node.state = NodeState.BACKOFF
-                    node.backoff_time = self.calculate_backoff_time(node)
-            
-            elif node.state == NodeState.BACKOFF:
-                node.backoff_time -= 1
-                if node.backoff_time <= 0:
-                    node.state = NodeState.IDLE
-    
-    def calculate_backoff_time(self, node: EthernetNode) -> int:
-        """Oblicza czas backoff"""
-        return node.calculate_backoff() * self.slot_time
+                    # Medium zajęte - czekaj
+                    states[i] = NodeState.LISTENING
+                    self._busy_count += 1
+                    sc[NodeState.IDLE] -= 1
+                    sc[NodeState.LISTENING] += 1
+
+        # LISTENING -> TRANSMITTING gdy medium się zwolniło
+        if n_listen:
+            for i in np.nonzero((st0 == NodeState.LISTENING) & idle_here)[0]:
+                self._start_transmission(i)
+
+        if n_tx:
+            # TRANSMITTING: wykryta kolizja wysyła sygnał JAM i zwraca ramkę
+            is_tx = st0 == NodeState.TRANSMITTING
+            for i in np.nonzero(is_tx & collision_here)[0]:
+                states[i] = NodeState.JAMMING
+                self.jam_duration[i] = 5  # Czas trwania sygnału JAM
+                self.collision_count[i] += 1
+                sc[NodeState.TRANSMITTING] -= 1
+                sc[NodeState.JAMMING] += 1
+                # Zwróć ramkę na początek kolejki
+                h = (self.queue_head[i] - 1) % QUEUE_CAPACITY
+                self.queue[i, h] = self.current_len[i]
+                self.queue_head[i] = h
+                self.queue_len[i] += 1
+                self._queued_count += 1
+                self.statistics['collisions'] += 1
+
+            # TRANSMITTING bez kolizji: odliczanie i zakończenie transmisji
+            ongoing = is_tx & ~collision_here
+            self.tx_time[ongoing] -= 1
+            done = ongoing & (self.tx_time <= 0)
+            states[done] = NodeState.IDLE
+            self.collision_count[done] = 0
+            self.successful_tx[done] += 1
+            n_done = int(done.sum())
+            self._busy_count -= n_done
+            sc[NodeState.TRANSMITTING] -= n_done
+            sc[NodeState.IDLE] += n_done
+            self.statistics['successful_transmissions'] += n_done
+
+        # JAMMING: odliczanie sygnału JAM, potem losowanie backoffu
+        if n_jam:
+            jamming = st0 == NodeState.JAMMING
+            self.jam_duration[jamming] -= 1
+            for i in np.nonzero(jamming & (self.jam_duration <= 0))[0]:
+                states[i] = NodeState.BACKOFF
+                self.backoff_time[i] = self.calculate_backoff_time(i)
+                sc[NodeState.JAMMING] -= 1
+                sc[NodeState.BACKOFF] += 1
+
+        # BACKOFF: odliczanie do powrotu w stan IDLE
+        if n_back:
+            backing = st0 == NodeState.BACKOFF
+            self.backoff_time[backing] -= 1
+            back_done = backing & (self.backoff_time <= 0)
+            states[back_done] = NodeState.IDLE
+            n_b = int(back_done.sum())
+            self._busy_count -= n_b
+            sc[NodeState.BACKOFF] -= n_b
+            sc[NodeState.IDLE] += n_b
+
+    def calculate_backoff_time(self, i: int) -> int:
+        """Oblicza czas backoff dla węzła i"""
+        if self.collision_count[i] > 10:
+            self.collision_count[i] = 10  # Maksymalnie 2^10 slotów
+        slots = self.nodes[i].calculate_backoff(int(self.collision_count[i]))
+        return slots * self.slot_time
     
     def print_network_state(self):
         """Wyświetla aktualny stan sieci"""
-        print(f"\n=== Krok czasowy: {self.time_step} ===")
-        
-        # Stan medium
-        cable_display = []
-        for i, signal in enumerate(self.cable):
-            if signal == SignalType.IDLE:
-                cable_display.append('-')
-            elif signal == SignalType.DATA:
-                cable_display.append('D')
-            elif signal == SignalType.COLLISION:
-                cable_display.append('X')
-            elif signal == SignalType.JAM:
-                cable_display.append('J')
-        
-        print("Medium: ", ''.join(cable_display))
-        
+        # Składamy cały zrzut w liście i piszemy jednym wywołaniem -
+        # przy print_interval=1 wiele małych printów potrafi dominować krok
+        lines = [f"\n=== Krok czasowy: {self.time_step} ==="]
+
+        # Stan medium - translate mapuje kody sygnałów na znaki w jednym kroku
+        lines.append(f"Medium:  {self.cable.tobytes().translate(self._disp_table).decode('ascii')}")
+
         # Pozycje węzłów
-        node_display = [' '] * self.cable_length
-        for node in self.nodes:
-            node_display[node.position] = str(node.node_id)
-        print("Węzły:  ", ''.join(node_display))
-        
+        lines.append(f"Węzły:   {self._node_line}")
+
         # Stany węzłów
-        print("\nStany węzłów:")
-        for node in self.nodes:
-            queue_size = len(node.data_to_send)
-            print(f"  Węzeł {node.node_id}: {node.state.value:12} | "
-                  f"Kolejka: {queue_size} | Kolizje: {node.collision_count} | "
-                  f"Udane: {node.successful_transmissions}")
+        lines.append("\nStany węzłów:")
+        for i, node in enumerate(self.nodes):
+            queue_size = self.queue_len[i]
+            lines.append(f"  Węzeł {node.node_id}: {NODE_STATE_LABELS[self.node_state[i]]:12} | "
+                         f"Kolejka: {queue_size} | Kolizje: {self.collision_count[i]} | "
+                         f"Udane: {self.successful_tx[i]}")
+
+        sys.stdout.write('\n'.join(lines) + '\n')
     
     def print_statistics(self):
         """Wyświetla statystyki symulacji"""
-        print(f"\n{'='*50}")
-        print("STATYSTYKI SYMULACJI")
-        print(f"{'='*50}")
-        print(f"Całkowite próby transmisji: {self.statistics['total_transmissions']}")
-        print(f"Udane transmisje:          {self.statistics['successful_transmissions']}")
-        print(f"Kolizje:                   {self.statistics['collisions']}")
-        
+        lines = [f"\n{'='*50}",
+                 "STATYSTYKI SYMULACJI",
+                 f"{'='*50}",
+                 f"Całkowite próby transmisji: {self.statistics['total_transmissions']}",
+                 f"Udane transmisje:          {self.statistics['successful_transmissions']}",
+                 f"Kolizje:                   {self.statistics['collisions']}"]
+
         if self.statistics['total_transmissions'] > 0:
-            success_rate = (self.statistics['successful_transmissions'] / 
+            success_rate = (self.statistics['successful_transmissions'] /
                           self.statistics['total_transmissions']) * 100
-            collision_rate = (self.statistics['collisions'] / 
+            collision_rate = (self.statistics['collisions'] /
                             self.statistics['total_transmissions']) * 100
-            print(f"Wskaźnik sukcesu:          {success_rate:.1f}%")
-            print(f"Wskaźnik kolizji:          {collision_rate:.1f}%")
-        
-        print(f"\nStatystyki poszczególnych węzłów:")
-        for node in self.nodes:
-            print(f"  Węzeł {node.node_id}: {node.successful_transmissions} udanych, "
-                  f"{node.total_attempts} prób")
+            lines.append(f"Wskaźnik sukcesu:          {success_rate:.1f}%")
+            lines.append(f"Wskaźnik kolizji:          {collision_rate:.1f}%")
+
+        lines.append(f"\nStatystyki poszczególnych węzłów:")
+        for i, node in enumerate(self.nodes):
+            lines.append(f"  Węzeł {node.node_id}: {self.successful_tx[i]} udanych, "
+                         f"{self.total_attempts[i]} prób")
+
+        sys.stdout.write('\n'.join(lines) + '\n')
     
-    def add_random_traffic(self, probability: float = 0.1):
-        """Dodaje losowy ruch do węzłów"""
-        for node in self.nodes:
-            if random.random() < probability and len(node.data_to_send) < 5:
-                frame_size = random.randint(10, 50)  # Losowy rozmiar ramki
-                frame_data = f"Frame_{self.time_step}_{node.node_id}"
-                node.add_data(frame_data)
+    def add_random_traffic(self, step: int):
+        """Dodaje losowy ruch do węzłów według planu wylosowanego z góry"""
+        row = self._traffic_ok[step]
+        lens = self._frame_lens[step]
+        for i in range(len(self.nodes)):
+            if row[i] and self.queue_len[i] < 5:
+                self._enqueue(i, int(lens[i]))
+
+    def _make_traffic_schedule(self, steps: int, traffic_probability: float):
+        """Losuje cały plan ruchu jedną generacją zamiast wywołań per krok.
+
+        Rozmiar ramki to długość jej etykiety "Frame_<krok>_<węzeł>",
+        więc macierz długości jest deterministyczna.
+        """
+        num_nodes = len(self.nodes)
+        rng = np.random.default_rng()
+        self._traffic_ok = rng.random((steps, num_nodes)) < traffic_probability
+
+        t0 = self.time_step
+        step_len = np.fromiter(
+            (len(f"Frame_{t}_") for t in range(t0, t0 + steps)),
+            dtype=np.int32, count=steps)
+        id_len = np.fromiter(
+            (len(str(node.node_id)) for node in self.nodes),
+            dtype=np.int32, count=num_nodes)
+        self._frame_lens = (step_len[:, None] + id_len).astype(np.int32)
     
     def simulate_step(self):
         """Wykonuje jeden krok symulacji"""
@@ -238,26 +621,91 @@ class EthernetSimulator:
         self.update_node_states()
         self.time_step += 1
     
-    def run_simulation(self, steps: int = 100, traffic_probability: float = 0.1, 
-                      verbose: bool = True, print_interval: int = 10):
-        """Uruchamia symulację"""
+    def _run_compiled(self, steps: int, verbose: bool, print_interval: int,
+                      debug_pause: float = 0.0):
+        """Pętla symulacji w jądrze numby, przerywana tylko na wydruki"""
+        traffic_ok = self._traffic_ok
+        frame_lens = self._frame_lens
+
+        step = 0
+        while step < steps:
+            if verbose:
+                # Jedź do najbliższego kroku, po którym trzeba drukować
+                end = step
+                while end < steps - 1 and not (end % print_interval == 0 or end < 20):
+                    end += 1
+                chunk = end - step + 1
+            else:
+                chunk = steps - step
+
+            _simulate_steps(
+                self.cable, self._cable_buf, self._tx_val, self._tx_cnt,
+                self.propagation_delay, self.node_positions,
+                self.node_state, self.tx_time, self.backoff_time,
+                self.collision_count, self.jam_duration,
+                self.successful_tx, self.total_attempts,
+                self.current_len, self.queue, self.queue_head, self.queue_len,
+                traffic_ok, frame_lens, self._stats, self.slot_time,
+                step, chunk)
+            self.time_step += chunk
+            last = step + chunk - 1
+            step += chunk
+
+            # Przepisz statystyki z tablicy jądra do słownika
+            self.statistics['total_transmissions'] = int(self._stats[0])
+            self.statistics['successful_transmissions'] = int(self._stats[1])
+            self.statistics['collisions'] = int(self._stats[2])
+
+            if verbose and (last % print_interval == 0 or last < 20):
+                self.print_network_state()
+                if debug_pause and last < 20:
+                    # Opcjonalna pauza na początku dla lepszej obserwacji
+                    time.sleep(debug_pause)
+
+        # Jądro modyfikuje stany i kolejki bezpośrednio - odtwórz liczniki
+        # obsady stanów i pustych kroków, żeby ścieżka interpretowana
+        # (np. ręczne simulate_step po run_simulation) widziała spójny stan
+        counts = np.bincount(self.node_state, minlength=len(NodeState))
+        self._state_count[:] = counts
+        self._busy_count = int(len(self.nodes) - counts[NodeState.IDLE])
+        self._queued_count = int(self.queue_len.sum())
+
+    def run_simulation(self, steps: int = 100, traffic_probability: float = 0.1,
+                      verbose: bool = True, print_interval: int = 10,
+                      debug_pause: float = 0.0):
+        """Uruchamia symulację
+
+        debug_pause > 0 wstrzymuje wykonanie po każdym z pierwszych 20
+        kroków o podaną liczbę sekund (wygodne przy śledzeniu stanu sieci);
+        domyślnie symulacja biegnie bez sztucznych opóźnień.
+        """
         print(f"Rozpoczynam symulację CSMA/CD")
         print(f"Długość kabla: {self.cable_length}, Węzły: {len(self.nodes)}")
         print(f"Pozycje węzłów: {[node.position for node in self.nodes]}")
-        
-        for step in range(steps):
-            # Dodaj losowy ruch
-            self.add_random_traffic(traffic_probability)
-            
-            # Wykonaj krok symulacji
-            self.simulate_step()
-            
-            # Wyświetl stan co określoną liczbę kroków
-            if verbose and (step % print_interval == 0 or step < 20):
-                self.print_network_state()
-                if step < 20:  # Pauza tylko na początku dla lepszej obserwacji
-                    time.sleep(0.5)
-        
+
+        # Ramki dodane przez add_data trafiają do kolejek symulacji
+        self._load_queues()
+
+        # Cały plan losowego ruchu powstaje przed pętlą
+        self._make_traffic_schedule(steps, traffic_probability)
+
+        if _njit is not None:
+            self._run_compiled(steps, verbose, print_interval, debug_pause)
+        else:
+            for step in range(steps):
+                # Dodaj losowy ruch
+                self.add_random_traffic(step)
+
+                # Wykonaj krok symulacji
+                self.simulate_step()
+
+                # Wyświetl stan co określoną liczbę kroków
+                if verbose and (step % print_interval == 0 or step < 20):
+                    self.print_network_state()
+                    if debug_pause and step < 20:
+                        # Opcjonalna pauza na początku dla lepszej obserwacji
+                        time.sleep(debug_pause)
+
         # Podsumowanie
         self.print_statistics()
 
@@ -2,145 +2,185 @@
 # -*- coding: utf-8 -*-
 
 import sys
+from functools import lru_cache
 from typing import List, Tuple
 
+def _build_crc8_table(poly: int = 0x07) -> List[int]:
+    """Buduje 256-elementową tablicę CRC-8 dla podanego wielomianu"""
+    table = []
+    for byte in range(256):
+        crc = byte
+        for _ in range(8):
+            if crc & 0x80:
+                crc = ((crc << 1) ^ poly) & 0xFF
+            else:
+                crc = (crc << 1) & 0xFF
+        table.append(crc)
+    return table
+
+# Opcjonalna natywna wersja pętli CRC (Numba); bez numby działa czysty Python
+try:
+    import numpy as _np
+    from numba import njit as _njit
+except ImportError:
+    _np = None
+    _njit = None
+
+if _njit is not None:
+    _CRC8_TABLE_NP = _np.array(_build_crc8_table(0x07), dtype=_np.uint8)
+
+    @_njit(cache=True)
+    def _crc8_native(buf, table):
+        """Pętla CRC-8 po bajtach skompilowana do kodu natywnego"""
+        crc = 0
+        for i in range(buf.shape[0]):
+            crc = table[crc ^ buf[i]]
+        return crc
+
+_CRC8_TABLE = _build_crc8_table(0x07)
+
+@lru_cache(maxsize=1 << 16)
+def _crc8_bits(data: bytes) -> int:
+    """Oblicza CRC-8 dla ciągu bitów '0'/'1' podanego jako bytes.
+
+    Wyniki są memoizowane per unikalny blok: pliki o powtarzających się
+    wzorcach (np. 64-bitowe bloki w encode_file) liczą CRC tylko raz,
+    a dla danych różnorodnych cache po prostu chybia bez kosztu.
+    """
+    if not data:
+        return 0
+
+    # Pakujemy ciąg bitów do bajtów - wiodące zera nie zmieniają CRC
+    # (rejestr startuje od 0), więc dopełnienie z lewej jest bezpieczne
+    packed = int(data, 2).to_bytes((len(data) + 7) // 8, 'big')
+
+    # Gorąca pętla w kodzie natywnym, jeśli numba jest dostępna
+    if _njit is not None:
+        buf = _np.frombuffer(packed, dtype=_np.uint8)
+        return int(_crc8_native(buf, _CRC8_TABLE_NP))
+
+    # Przetwarzamy bajt po bajcie przez tablicę CRC
+    crc = 0
+    for byte in packed:
+        crc = _CRC8_TABLE[crc ^ byte]
+
+    return crc
+
 class FrameProcessor:
+    # Tablica CRC-8 dla wielomianu 0x07: x^8 + x^2 + x^1 + 1 = 100000111
+    CRC8_TABLE = _CRC8_TABLE
+
+    # Tablica translacji do walidacji: '0' i '1' mapują się na \x00,
+    # więc po translate+strip cokolwiek zostanie, jest nieprawidłowym znakiem
+    _VALID_BITS = bytes.maketrans(b'01', b'\x00\x00')
+
+    # Flaga jako liczba - składanie ramki idzie przez przesunięcia bitowe
+    FLAG_INT = 0b01111110
+
     def __init__(self):
-        # Flaga ramki - sekwencja 01111110
-        self.FLAG = "01111110"
+        # Flaga ramki - sekwencja 01111110 (bity jako bajty ASCII '0'/'1')
+        self.FLAG = b"01111110"
         # Wielomian CRC-8: x^8 + x^2 + x^1 + 1 = 100000111
         self.CRC_POLY = "100000111"
-        
-    def crc_calculate(self, data: str) -> str:
-        """Oblicza CRC dla podanych danych"""
-        # Dodajemy 8 zer na końcu (długość CRC)
-        dividend = data + "0" * 8
-        divisor = self.CRC_POLY
-        
-        # Konwersja na listy dla łatwiejszej manipulacji
-        dividend_bits = list(dividend)
-        divisor_bits = list(divisor)
-        
-        for i in range(len(data)):
-            if dividend_bits[i] == '1':
-                # XOR operation
-                for j in range(len(divisor_bits)):
-                    if i + j < len(dividend_bits):
-                        dividend_bits[i + j] = str(int(dividend_bits[i + j]) ^ int(divisor_bits[j]))
-        
-        # Zwracamy ostatnie 8 bitów jako CRC
-        return ''.join(dividend_bits[-8:])
-    
-    def bit_stuffing(self, data: str) -> str:
+
+    def crc_calculate(self, data: bytes) -> int:
+        """Oblicza CRC dla podanych danych (ciąg bitów '0'/'1' jako bytes)"""
+        return _crc8_bits(bytes(data))
+
+    def bit_stuffing(self, data: bytes) -> bytes:
         """Implementuje zasadę rozpychania bitów - wstawia 0 po pięciu kolejnych 1"""
-        result = ""
-        count_ones = 0
-        
-        for bit in data:
-            result += bit
-            if bit == '1':
-                count_ones += 1
-                if count_ones == 5:
-                    result += '0'  # Wstawiamy 0 po pięciu 1
-                    count_ones = 0
-            else:
-                count_ones = 0
-                
-        return result
-    
-    def bit_destuffing(self, data: str) -> str:
+        # bytes.replace skanuje od lewej bez nakładania się dopasowań, więc
+        # jedno przejście wstawia 0 dokładnie po każdych pięciu kolejnych 1
+        # (licznik jedynek "zeruje się" po każdym dopasowaniu, jak w pętli)
+        return data.replace(b'11111', b'111110')
+
+    def bit_destuffing(self, data: bytes) -> bytes:
         """Usuwa bity wstawione podczas bit stuffing"""
-        result = ""
-        count_ones = 0
-        i = 0
-        
-        while i < len(data):
-            bit = data[i]
-            result += bit
-            
-            if bit == '1':
-                count_ones += 1
-                if count_ones == 5:
-                    # Sprawdzamy czy następny bit to 0 (bit stuffing)
-                    if i + 1 < len(data) and data[i + 1] == '0':
-                        i += 1  # Pomijamy wstawiony 0
-                    count_ones = 0
-            else:
-                count_ones = 0
-            
-            i += 1
-                
-        return result
+        # Operacja odwrotna: usuwamy 0 występujące po pięciu kolejnych 1;
+        # po poprawnym stuffingu nie ma ciągów dłuższych niż pięć 1, więc
+        # każde wystąpienie '111110' to dokładnie jeden wstawiony bit
+        return data.replace(b'111110', b'11111')
 
-    def create_frame(self, data: str) -> str:
+    def create_frame(self, data: bytes) -> bytes:
         """Tworzy ramkę z danymi"""
         # 1. Oblicz CRC
         crc = self.crc_calculate(data)
-        
+
         # 2. Połącz dane z CRC
-        data_with_crc = data + crc
-        
+        data_with_crc = data + format(crc, '08b').encode('ascii')
+
         # 3. Zastosuj bit stuffing
         stuffed_data = self.bit_stuffing(data_with_crc)
-        
-        # 4. Dodaj flagi na początku i końcu
-        frame = self.FLAG + stuffed_data + self.FLAG
-        
-        return frame
-    
-    def parse_frame(self, frame: str) -> Tuple[bool, str]:
+
+        # 4. Dodaj flagi na początku i końcu - składamy ramkę jako jedną
+        # liczbę przesunięciami (operacje na bigintach w C), a na ciąg
+        # bitów konwertujemy dopiero raz na końcu
+        plen = len(stuffed_data)
+        frame_int = (self.FLAG_INT << (plen + 8)) \
+            | (int(stuffed_data, 2) << 8) | self.FLAG_INT
+
+        return format(frame_int, f'0{plen + 16}b').encode('ascii')
+
+    def parse_frame(self, frame: bytes) -> Tuple[bool, bytes]:
         """Parsuje ramkę i zwraca (czy_poprawna, dane)"""
         # 1. Sprawdź czy ramka zaczyna i kończy się flagą
         if not (frame.startswith(self.FLAG) and frame.endswith(self.FLAG)):
-            return False, ""
-        
+            return False, b""
+
         # 2. Usuń flagi
         data_stuffed = frame[len(self.FLAG):-len(self.FLAG)]
-        
+
+        # Zawartość musi być ciągiem '0'/'1' - konwersje int(..., 2) niżej
+        # rzuciłyby ValueError na uszkodzonej ramce zamiast ją odrzucić
+        if data_stuffed.translate(self._VALID_BITS).strip(b'\x00'):
+            return False, b""
+
         # 3. Usuń bit stuffing
         data_with_crc = self.bit_destuffing(data_stuffed)
-        
+
         # 4. Sprawdź długość (musi być co najmniej 8 bitów dla CRC)
         if len(data_with_crc) < 8:
-            return False, ""
-        
+            return False, b""
+
         # 5. Podziel na dane i CRC
         data = data_with_crc[:-8]
         received_crc = data_with_crc[-8:]
-        
+
         # 6. Oblicz CRC dla otrzymanych danych
         calculated_crc = self.crc_calculate(data)
-        
+
         # 7. Sprawdź poprawność CRC
-        if received_crc == calculated_crc:
+        if int(received_crc, 2) == calculated_crc:
             return True, data
         else:
-            return False, ""
+            return False, b""
     
     def encode_file(self, input_filename: str, output_filename: str):
         """Koduje plik wejściowy do ramek"""
         try:
-            with open(input_filename, 'r') as f:
+            # Czytamy binarnie - pipeline pracuje na bajtach '0'/'1'
+            with open(input_filename, 'rb') as f:
                 data = f.read().strip()
-            
-            # Sprawdź czy dane zawierają tylko 0 i 1
-            if not all(c in '01' for c in data):
+
+            # Sprawdź czy dane zawierają tylko 0 i 1 - jedno przejście
+            # translate w C zamiast pętli generatora po każdym znaku
+            if data.translate(self._VALID_BITS).strip(b'\x00'):
                 print(f"Błąd: Plik {input_filename} zawiera nieprawidłowe znaki. Dozwolone tylko '0' i '1'.")
                 return False
-            
+
             # Podziel dane na bloki (np. 64 bity na ramkę)
             block_size = 64
             frames = []
-            
+
             for i in range(0, len(data), block_size):
                 block = data[i:i + block_size]
                 frame = self.create_frame(block)
                 frames.append(frame)
-            
-            # Zapisz ramki do pliku
-            with open(output_filename, 'w') as f:
-                for frame in frames:
-                    f.write(frame + '\n')
+
+            # Zapisz ramki do pliku - jeden write zamiast wywołania na ramkę,
+            # więc cały plik wychodzi w jednym wywołaniu systemowym
+            with open(output_filename, 'wb') as f:
+                f.write(b'\n'.join(frames) + b'\n')
             
             print(f"Zakodowano {len(frames)} ramek z pliku {input_filename} do {output_filename}")
             return True
@@ -155,7 +195,7 @@ class FrameProcessor:
     def decode_file(self, input_filename: str, output_filename: str):
         """Dekoduje ramki z pliku"""
         try:
-            with open(input_filename, 'r') as f:
+            with open(input_filename, 'rb') as f:
                 lines = f.readlines()
             
             decoded_data = []
@@ -179,8 +219,8 @@ class FrameProcessor:
             
             # Zapisz zdekodowane dane
             if decoded_data:
-                with open(output_filename, 'w') as f:
-                    f.write(''.join(decoded_data))
+                with open(output_filename, 'wb') as f:
+                    f.write(b''.join(decoded_data))
                 
                 print(f"\nZdekodowano {valid_frames} poprawnych ramek")
                 print(f"Pominięto {invalid_frames} błędnych ramek")
@@ -1,22 +1,84 @@
-from http.server import SimpleHTTPRequestHandler, HTTPServer
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 import os
+import stat
+import threading
+
+# Katalog z plikami statycznymi obok tego pliku
+WWW_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "www")
 
 class CustomHandler(SimpleHTTPRequestHandler):
+    # Pamięciowy cache małych plików statycznych: ścieżka -> (treść,
+    # mtime_ns, typ MIME). Wpis jest ważny, dopóki mtime pliku się nie
+    # zmieni, więc edycja pliku unieważnia go automatycznie
+    _cache = {}
+    _cache_lock = threading.Lock()
+    _CACHE_MAX_SIZE = 1 << 20  # większe pliki idą zwykłą ścieżką z dysku
+
+    def __init__(self, *args, **kwargs):
+        # Handler serwuje bezpośrednio z www/ (directory=), bez przepisywania
+        # self.path i bez zależności od bieżącego katalogu procesu
+        super().__init__(*args, directory=WWW_DIR, **kwargs)
+
     def do_GET(self):
         if self.path == "/headers":
+            # Składamy blok nagłówków z par items() od razu w bajty -
+            # bez pośredniego str(self.headers) i dodatkowego kodowania
+            payload = b''.join(
+                f"{name}: {value}\r\n".encode('latin-1')
+                for name, value in self.headers.items())
             self.send_response(200)
             self.send_header("Content-type", "text/plain")
+            self.send_header("Content-Length", str(len(payload)))
             self.end_headers()
-            self.wfile.write(str(self.headers).encode())
-        else:
-            # Obsługa plików statycznych z katalogu www/
-            if self.path == "/":
-                self.path = "/index.html"
-            self.path = "/www" + self.path
-            return super().do_GET()
+            self.wfile.write(payload)
+            return
+
+        # Obsługa plików statycznych z katalogu www/
+        if self.path == "/":
+            self.path = "/index.html"
+        if self._serve_cached():
+            return
+        return super().do_GET()
+
+    def _serve_cached(self):
+        """Serwuje mały plik statyczny z cache'a w pamięci.
+
+        Zamiast open + kopiowania z dysku przy każdym żądaniu robimy jeden
+        stat na walidację i jeden zapis do gniazda. Zwraca False, gdy
+        żądanie ma obsłużyć standardowa ścieżka (katalog, duży plik, 404).
+        """
+        full = self.translate_path(self.path)
+        try:
+            st = os.stat(full)
+        except OSError:
+            return False
+        if not stat.S_ISREG(st.st_mode) or st.st_size > self._CACHE_MAX_SIZE:
+            return False
+
+        with self._cache_lock:
+            entry = self._cache.get(full)
+        if entry is None or entry[1] != st.st_mtime_ns:
+            try:
+                with open(full, 'rb') as f:
+                    body = f.read()
+            except OSError:
+                return False
+            entry = (body, st.st_mtime_ns, self.guess_type(full))
+            with self._cache_lock:
+                self._cache[full] = entry
+
+        body, _, ctype = entry
+        self.send_response(200)
+        self.send_header("Content-Type", ctype)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Last-Modified", self.date_time_string(st.st_mtime))
+        self.end_headers()
+        self.wfile.write(body)
+        return True
 
 if __name__ == "__main__":
-    os.chdir(os.path.dirname(__file__))  # Ustaw katalog roboczy
-    server = HTTPServer(('0.0.0.0', 4321), CustomHandler)
+    # Wersja wielowątkowa - równoległe GET-y (np. zasoby jednej strony)
+    # nie czekają w kolejce na jeden wątek
+    server = ThreadingHTTPServer(('0.0.0.0', 4321), CustomHandler)
     print("Serwer działa na http://localhost:4321/")
     server.serve_forever()